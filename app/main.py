@@ -1670,15 +1670,19 @@ async def export_pdf(session_id: str, background_tasks: BackgroundTasks, request
     )
 
 
+VOICE_CATALOG_PATH = os.path.join(os.path.dirname(__file__), "voice_catalog.json")
+VOICES_DIR = os.path.join("app", "static", "voices")
+
+
 @lru_cache(maxsize=4)
-def _load_voice_catalog(_version: float) -> List[Dict[str, Any]]:
+def _load_voice_catalog(path: str, _version: float) -> List[Dict[str, Any]]:
     """Load static voice catalog from JSON file.
 
     The `_version` parameter should pass the file's last-modified time so that
     updates to `voice_catalog.json` are reflected without restarting the server
-    and without permanently disabling caching.
+    and without permanently disabling caching. `path` is part of the cache key
+    so a different catalog file never reuses another file's entry.
     """
-    path = os.path.join(os.path.dirname(__file__), "voice_catalog.json")
     try:
         with open(path, "r", encoding="utf-8") as f:
             import json as _json
@@ -1697,12 +1701,7 @@ async def list_voices():
 
     Includes a lightweight cache that invalidates when the JSON file changes.
     """
-    path = os.path.join(os.path.dirname(__file__), "voice_catalog.json")
-    try:
-        version = os.path.getmtime(path)
-    except Exception:
-        version = 0.0
-    raw = _load_voice_catalog(version)
+    raw = _catalog_lookup()
     return [VoiceDescriptor(**item) for item in raw if isinstance(item, dict)]
 
 
@@ -1719,12 +1718,7 @@ async def update_session_voice(session_id: str, request: SetVoiceRequest):
         raise HTTPException(status_code=400, detail="voice_id is required")
 
     # Validate against current catalog; invalidate cache on file changes
-    _catalog_path = os.path.join(os.path.dirname(__file__), "voice_catalog.json")
-    try:
-        _version = os.path.getmtime(_catalog_path)
-    except Exception:
-        _version = 0.0
-    catalog_ids = {item.get("id") for item in _load_voice_catalog(_version) if isinstance(item, dict)}
+    catalog_ids = {item.get("id") for item in _catalog_lookup() if isinstance(item, dict)}
     if catalog_ids and voice_id not in catalog_ids:
         raise HTTPException(status_code=400, detail="Unknown voice_id")
 
@@ -1738,12 +1732,11 @@ async def update_session_voice(session_id: str, request: SetVoiceRequest):
 
 def _catalog_lookup() -> List[Dict[str, Any]]:
     """Helper to return the current voice catalog with cache invalidation."""
-    path = os.path.join(os.path.dirname(__file__), "voice_catalog.json")
     try:
-        version = os.path.getmtime(path)
+        version = os.path.getmtime(VOICE_CATALOG_PATH)
     except Exception:
         version = 0.0
-    return _load_voice_catalog(version)
+    return _load_voice_catalog(VOICE_CATALOG_PATH, version)
 
 
 @app.get("/voices/preview/{voice_id}")
@@ -1765,7 +1758,7 @@ async def voice_preview(voice_id: str):
         raise HTTPException(status_code=404, detail="Unknown voice")
 
     # Serve cached/static file if present
-    static_dir = os.path.join("app", "static", "voices")
+    static_dir = VOICES_DIR
     os.makedirs(static_dir, exist_ok=True)
     filename = f"{voice_id}-preview.mp3"
     file_path = os.path.join(static_dir, filename)
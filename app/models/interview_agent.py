@@ -25,6 +25,8 @@ EVALUATION_JSON_SCHEMA = {
     "required": ["score", "strengths", "weaknesses", "feedback", "example_improvement", "why_asked"],
     "additionalProperties": False,
 }
+# Pretty-printed once; embedded verbatim in every evaluation prompt
+EVALUATION_JSON_SCHEMA_TEXT = json.dumps(EVALUATION_JSON_SCHEMA, indent=2)
 
 
 def get_base_coach_prompt() -> str:
@@ -186,7 +188,7 @@ class InterviewPracticeAgent:
         vt = (voice_transcript or "").strip()
         vt_block = f"\n\nVoice Transcript (if any):\n{vt}\n" if vt else ""
 
-        schema_block = json.dumps(EVALUATION_JSON_SCHEMA, indent=2)
+        schema_block = EVALUATION_JSON_SCHEMA_TEXT
         q_type = (question_type or "behavioral").strip().lower()
         if q_type not in {"behavioral", "narrative"}:
             q_type = "behavioral"
@@ -1,8 +1,10 @@
+from functools import lru_cache
 from typing import Literal
 
 CoachLevel = Literal["level_1", "level_2"]
 
 
+@lru_cache(maxsize=8)
 def build_dual_level_prompt(level: str) -> str:
     """Return the dual-level coach system prompt based on level.
 
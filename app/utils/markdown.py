@@ -1,7 +1,8 @@
+from functools import lru_cache
 from typing import Optional
 
-import bleach
-from markdown import markdown
+from bleach.sanitizer import Cleaner
+from markdown import Markdown
 
 ALLOWED_TAGS = [
     "p",
@@ -26,11 +27,20 @@ ALLOWED_ATTRIBUTES = {
     "pre": ["class"],
 }
 
+# Built once: extension loading and allowlist setup dominate short renders.
+# Neither object is thread-safe; all callers run on the event loop.
+_MD = Markdown(extensions=["extra"])
+_CLEANER = Cleaner(tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, strip=True)
 
+
+@lru_cache(maxsize=512)
 def render_markdown_safe(text: Optional[str]) -> str:
-    """Render Markdown to sanitized HTML suitable for display."""
+    """Render Markdown to sanitized HTML suitable for display.
+
+    Results are memoized; repeated coach/candidate lines render once.
+    """
     if not text:
         return ""
     # Convert to HTML first, then sanitize to avoid unsafe tags.
-    html = markdown(text, extensions=["extra"])
-    return bleach.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, strip=True)
+    html = _MD.reset().convert(text)
+    return _CLEANER.clean(html)
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 QUESTION_TYPE_BEHAVIORAL = "behavioral"
@@ -40,6 +41,7 @@ _BEHAVIORAL_KEYWORDS = {
 _PROMPT_LEADS = ("tell me about", "describe", "give me", "share", "walk me through")
 
 
+@lru_cache(maxsize=1024)
 def normalize_question_text(text: Optional[str]) -> str:
     """Normalize question text for stable overrides keys."""
     return " ".join((text or "").strip().lower().split())
@@ -21,15 +21,28 @@ def save_session(session_id: str, data: Dict[str, Any]) -> None:
     serializable = {key: value for key, value in data.items() if key != "agent"}
     # Stamp update time
     serializable["updated_at"] = datetime.utcnow().isoformat() + "Z"
-    _session_path(session_id).write_text(json.dumps(serializable, ensure_ascii=False), encoding="utf-8")
+    _write_bytes(session_id, json.dumps(serializable, ensure_ascii=False).encode("utf-8"))
 
 
-def load_session(session_id: str) -> Optional[Dict[str, Any]]:
-    """Load a saved session from disk, returning None when it is missing."""
+def _write_bytes(session_id: str, data: bytes) -> None:
+    """Write already-encoded session JSON for the given id."""
+    _session_path(session_id).write_bytes(data)
+
+
+def _read_bytes(session_id: str) -> Optional[bytes]:
+    """Return the encoded session JSON for the given id, or None when missing."""
     path = _session_path(session_id)
     if not path.exists():
         return None
-    data = json.loads(path.read_text(encoding="utf-8"))
+    return path.read_bytes()
+
+
+def load_session(session_id: str) -> Optional[Dict[str, Any]]:
+    """Load a saved session from disk, returning None when it is missing."""
+    raw = _read_bytes(session_id)
+    if raw is None:
+        return None
+    data = json.loads(raw)
     data["agent"] = None
     data.setdefault("voice_transcripts", {})
     data.setdefault("voice_agent_text", {})
@@ -58,9 +71,7 @@ def load_session(session_id: str) -> Optional[Dict[str, Any]]:
 
 def delete_session(session_id: str) -> None:
     """Remove persisted state for a session."""
-    path = _session_path(session_id)
-    if path.exists():
-        path.unlink()
+    _session_path(session_id).unlink(missing_ok=True)
 
 
 def list_sessions() -> List[Dict[str, Any]]:
@@ -0,0 +1,203 @@
+import re
+import shutil
+import sys
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import app.main as main  # noqa: E402
+import app.utils.session_store as store  # noqa: E402
+from app.utils.markdown import render_markdown_safe  # noqa: E402
+from fixtures import LiteralIndex, make_payload  # noqa: E402
+
+
+# Every app.js literal asserted by the UI tests; scanned once per session.
+JS_LITERALS = (
+    "!m.stream",
+    '"/session/${state.sessionId}/coach-level"',
+    "(sum, eval)",
+    "/coach-level",
+    "answerInput.classList.toggle(",
+    "appVoiceConfig",
+    "dataChannel.onopen",
+    "fetch(`/session/${state.sessionId}/coach-level`",
+    "fetch(`/session/${state.sessionId}`",
+    "fetch(`/session/`",
+    "forEach(eval =>",
+    "if (exportTranscriptBtn)",
+    "if (markReviewBtn)",
+    "if (openSessionsBtn && sessionsModal)",
+    "if (openSettingsBtn && voiceSettingsDrawer)",
+    "m.role === 'user'",
+    "markReviewBtn.addEventListener('click'",
+    "normalize(",
+    "openSessionsBtn.addEventListener('click'",
+    "openSettingsBtn.addEventListener('click'",
+    "realtime_model",
+    "replace(/[^a-z0-9]+/g, ' ')",
+    "sessionsLoadBtn.addEventListener('click'",
+    "sessionsRenameBtn.addEventListener('click'",
+    "setVoiceLayout(false);",
+    "setVoiceLayout(true);",
+    "startBrowserAsrIfAvailable()",
+    "suppressBrowserAsr",
+    "useBrowserAsr",
+    "useBrowserAsr && !state.voice.suppressBrowserAsr",
+    "useBrowserAsr: false",
+    "voiceTranscript.classList.toggle('max-h-64'",
+    "voiceTranscript.classList.toggle('max-h-96'",
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Single TestClient shared by API tests; requests re-dispatch per call."""
+    with TestClient(main.app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async client over httpx.ASGITransport; requests run on the test's loop, no thread hop."""
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def html_bytes():
+    """Raw app/templates/index.html, read once per test session."""
+    return (ROOT / "app" / "templates" / "index.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def html_source(html_bytes):
+    """Decoded index.html for regex and line-based checks."""
+    return html_bytes.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def html_ids(html_source):
+    """Every id="..." value in index.html, collected in one pass."""
+    return frozenset(re.findall(r'(?<![\w-])id="([^"]+)"', html_source))
+
+
+@pytest.fixture(scope="session")
+def js_bytes():
+    """Raw app/static/js/app.js, read once per test session."""
+    return (ROOT / "app" / "static" / "js" / "app.js").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def js_source(js_bytes):
+    """Decoded app.js for the symbol and literal scans."""
+    return js_bytes.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def js_symbols(js_source):
+    """Names declared in app.js via function/const/let/var/class."""
+    return frozenset(re.findall(r"\b(?:function|const|let|var|class)\s+([A-Za-z_$][\w$]*)", js_source))
+
+
+@pytest.fixture(scope="session")
+def js_hits(js_source):
+    """Which JS_LITERALS occur in app.js, found in a single pass."""
+    return LiteralIndex(js_source, JS_LITERALS)
+
+
+def _shm_dir():
+    shm = Path("/dev/shm")
+    return shm if shm.is_dir() else None
+
+
+@pytest.fixture
+def session_dir(request):
+    """Per-test session directory, RAM-backed via /dev/shm when available."""
+    base = _shm_dir()
+    if base is None:
+        yield request.getfixturevalue("tmp_path")
+        return
+    path = base / f"sess-{uuid.uuid4()}"
+    path.mkdir()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _patched_session_dir(monkeypatch, session_dir):
+    """Point the session store at the per-test session_dir for every test."""
+    monkeypatch.setattr(store, "SESSION_DIR", session_dir)
+    return session_dir
+
+
+@pytest.fixture(autouse=True)
+def _clean_sessions():
+    """Start and finish every test with an empty in-memory session cache."""
+    main.active_sessions.clear()
+    yield
+    main.active_sessions.clear()
+
+
+@pytest.fixture
+def memory_session_store(monkeypatch):
+    """Keep encoded session JSON in a dict instead of SESSION_DIR.
+
+    Payloads still round-trip through save_session/load_session, so defaults
+    and serialization match disk; only the file I/O is skipped. Listing and
+    deleting sessions still go to SESSION_DIR, so tests covering those keep
+    the real store.
+    """
+    blobs = {}
+    monkeypatch.setattr(store, "_write_bytes", blobs.__setitem__)
+    monkeypatch.setattr(store, "_read_bytes", blobs.get)
+    return blobs
+
+
+@pytest.fixture
+def seed_session():
+    """Persist session payloads under session_dir."""
+
+    def _make(sid, payload):
+        store.save_session(sid, payload)
+        return sid
+
+    return _make
+
+
+@pytest.fixture
+def session_factory():
+    """Persist a fresh sample session under a random id and return the id."""
+
+    def _create():
+        session_id = str(uuid.uuid4())
+        main._persist_session_state(
+            session_id,
+            make_payload(
+                resume_text="Sample resume",
+                job_desc_text="Sample job description",
+                name="test_session",
+                questions=["Tell me about yourself."],
+                created_at="2024-01-01T00:00:00Z",
+                updated_at="2024-01-01T00:00:00Z",
+            ),
+        )
+        return session_id
+
+    return _create
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clear_render_cache():
+    """Drop memoized Markdown renders when the test session ends."""
+    yield
+    render_markdown_safe.cache_clear()
@@ -0,0 +1,120 @@
+"""Shared test data and helpers for the test suite."""
+
+import json
+import re
+
+import httpx
+
+try:  # Optional: pyahocorasick gives a single automaton pass over the text
+    import ahocorasick
+except Exception:  # pragma: no cover - fall back to the regex scan
+    ahocorasick = None
+
+
+# Captured before tests monkeypatch httpx.AsyncClient with the factory below.
+_ASYNC_CLIENT = httpx.AsyncClient
+
+
+BASE_PAYLOAD = {
+    "resume_path": "uploads/resume.txt",
+    "job_desc_path": "uploads/job.txt",
+    "resume_text": "R",
+    "job_desc_text": "JD",
+    "questions": [],
+    "answers": [],
+    "evaluations": [],
+    "agent": None,
+    "current_question_index": 0,
+    "voice_transcripts": {},
+    "voice_agent_text": {},
+    "voice_messages": [],
+}
+
+
+def make_payload(**overrides):
+    """Return a fresh session payload: BASE_PAYLOAD updated with overrides.
+
+    BASE_PAYLOAD only holds scalars and empty containers, so a shallow copy
+    with fresh containers is enough to keep callers from sharing state.
+    """
+    payload = {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in BASE_PAYLOAD.items()
+    }
+    payload.update(overrides)
+    return payload
+
+
+class LiteralIndex:
+    """Presence index for a fixed set of literals, built with one scan.
+
+    With pyahocorasick installed, one Aho-Corasick automaton pass reports
+    every occurrence, overlapping and nested ones included. Without it, a
+    zero-width lookahead alternation (longest needles first) records the
+    longest literal starting at each position; any registered literal that is
+    a substring of a recorded hit is present too, which covers overlaps and
+    nested needles that plain ``findall`` would skip.
+    """
+
+    def __init__(self, text, literals):
+        needles = sorted(set(literals), key=len, reverse=True)
+        self._literals = frozenset(needles)
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for needle in needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+            self._hits = frozenset(needle for _, needle in automaton.iter(text))
+            return
+        pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, needles)))
+        found = set(pattern.findall(text))
+        self._hits = frozenset(n for n in needles if any(n in hit for hit in found))
+
+    def __contains__(self, literal):
+        if literal not in self._literals:
+            raise KeyError(f"literal not registered for scanning: {literal!r}")
+        return literal in self._hits
+
+
+def realtime_session_response(request_json):
+    """Successful realtime session body echoing the requested model."""
+    return {
+        "id": "sess_123",
+        "model": request_json.get("model", "gpt-realtime-mini"),
+        "client_secret": {"value": "secret_abc"},
+        # Any epoch-like int works for model validation
+        "expires_at": 4102444800,
+    }
+
+
+def make_fake_httpx_client(captured, *, response_json=realtime_session_response, response_content=b""):
+    """Return an httpx.AsyncClient factory backed by an httpx.MockTransport.
+
+    Each request is recorded into ``captured``: the url and decoded JSON body
+    as sent, and the ``headers=`` argument exactly as the caller passed it to
+    ``post`` (not httpx's normalized request headers). ``response_json`` is either the body to return or a callable that
+    builds it from the outbound JSON; pass ``None`` to return
+    ``response_content`` as raw bytes instead.
+    """
+
+    def _handler(request):
+        body = json.loads(request.content) if request.content else None
+        captured["url"] = str(request.url)
+        captured["json"] = body
+        if response_json is None:
+            return httpx.Response(200, content=response_content)
+        payload = response_json(body) if callable(response_json) else response_json
+        return httpx.Response(200, json=payload)
+
+    transport = httpx.MockTransport(_handler)
+
+    class _RecordingClient(_ASYNC_CLIENT):
+        async def post(self, url, *args, **kwargs):
+            captured["headers"] = kwargs.get("headers")
+            return await super().post(url, *args, **kwargs)
+
+    def _factory(*args, **kwargs):
+        kwargs["transport"] = transport
+        return _RecordingClient(*args, **kwargs)
+
+    return _factory
@@ -1,41 +1,22 @@
-import sys
 import uuid
-from pathlib import Path
 
-from fastapi.testclient import TestClient
-
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import app.main as main  # noqa: E402
+import app.main as main
+from fixtures import make_payload
 
 
 def _session_payload():
     now = "2024-01-01T00:00:00Z"
-    return {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample resume text",
-        "job_desc_text": "Sample job description",
-        "name": "custom_question_session",
-        "questions": [],
-        "answers": [],
-        "evaluations": [],
-        "per_question": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
+    return make_payload(
+        resume_text="Sample resume text",
+        job_desc_text="Sample job description",
+        name="custom_question_session",
+        per_question=[],
+        created_at=now,
+        updated_at=now,
+    )
 
 
-def test_add_custom_question_appends_and_activates():
-    client = TestClient(main.app)
+def test_add_custom_question_appends_and_activates(client):
     sid = str(uuid.uuid4())
     payload = _session_payload()
     payload["questions"] = ["Tell me about yourself."]
@@ -57,8 +38,7 @@ def test_add_custom_question_appends_and_activates():
     assert len(session.get("per_question")) == len(session["questions"])
 
 
-def test_add_custom_question_trims_and_deduplicates():
-    client = TestClient(main.app)
+def test_add_custom_question_trims_and_deduplicates(client):
     sid = str(uuid.uuid4())
     payload = _session_payload()
     payload["questions"] = ["Why do you want this role?"]
@@ -80,9 +60,5 @@ def test_add_custom_question_trims_and_deduplicates():
     assert session["questions"] == ["Why do you want this role?"]
 
 
-def test_custom_question_controls_render_in_template():
-    html_path = ROOT / "app" / "templates" / "index.html"
-    html = html_path.read_text(encoding="utf-8")
-    assert 'id="custom-question-input"' in html
-    assert 'id="add-custom-question"' in html
-    assert 'id="clear-custom-question"' in html
+def test_custom_question_controls_render_in_template(html_ids):
+    assert {"custom-question-input", "add-custom-question", "clear-custom-question"} <= html_ids
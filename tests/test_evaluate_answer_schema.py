@@ -1,16 +1,8 @@
 import logging
-import sys
-from pathlib import Path
 
-import pytest
-from fastapi.testclient import TestClient
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import app.main as main  # noqa: E402
-import app.utils.session_store as store  # noqa: E402
+import app.main as main
+import app.utils.session_store as store
+from fixtures import make_payload
 
 
 class _InvalidAgent:
@@ -25,31 +17,14 @@ class _InvalidAgent:
         return {"foo": "bar"}
 
 
-def _seed_session(tmp_path):
-    sid = "s-eval-schema"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "R",
-        "job_desc_text": "JD",
-        "name": "schema_test",
-        "questions": ["Q1"],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
-    main.active_sessions.clear()
-    store.save_session(sid, payload)
-    return sid
+_PAYLOAD = make_payload(
+    name="schema_test",
+    questions=["Q1"],
+)
 
 
-def test_invalid_evaluation_payload_uses_fallback_and_logs_at_info(monkeypatch, tmp_path, caplog):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
-    sid = _seed_session(tmp_path)
+def test_invalid_evaluation_payload_uses_fallback_and_logs_at_info(monkeypatch, seed_session, caplog, client):
+    sid = seed_session("s-eval-schema", _PAYLOAD)
 
     # Shared counter to track all agent calls across retries
     call_counter = {"count": 0}
@@ -65,7 +40,6 @@ def test_invalid_evaluation_payload_uses_fallback_and_logs_at_info(monkeypatch,
         store.save_session(session_id, sess)
 
     monkeypatch.setattr(main, "start_agent", _fake_start_agent)
-    client = TestClient(main.app)
 
     caplog.set_level(logging.INFO)
     resp = client.post(
@@ -1,17 +1,33 @@
 import json
-import sys
 from types import SimpleNamespace
-from pathlib import Path
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from app.models.interview_agent import (  # noqa: E402
+from app.models.interview_agent import (
     InterviewPracticeAgent,
     EVALUATION_JSON_SCHEMA,
+    EVALUATION_JSON_SCHEMA_TEXT,
+)
+
+
+_RESPONSE = SimpleNamespace(
+    choices=[
+        SimpleNamespace(
+            message=SimpleNamespace(
+                content=json.dumps(
+                    {
+                        "score": 5,
+                        "strengths": [],
+                        "weaknesses": [],
+                        "improvements": [],
+                        "feedback": "",
+                        "example_improvement": "",
+                        "why_asked": "",
+                    }
+                )
+            )
+        )
+    ]
 )
 
 
@@ -21,25 +37,7 @@ class _StubCompletions:
 
     async def create(self, model, messages, **kwargs):
         self.log.append(messages)
-        return SimpleNamespace(
-            choices=[
-                SimpleNamespace(
-                    message=SimpleNamespace(
-                        content=json.dumps(
-                            {
-                                "score": 5,
-                                "strengths": [],
-                                "weaknesses": [],
-                                "improvements": [],
-                                "feedback": "",
-                                "example_improvement": "",
-                                "why_asked": "",
-                            }
-                        )
-                    )
-                )
-            ]
-        )
+        return _RESPONSE
 
 
 class _StubClient:
@@ -65,8 +63,8 @@ async def test_evaluation_prompt_includes_json_schema():
     last_request = sent_messages[-1]
     user_msg = next((m for m in last_request if m.get("role") == "user"), {})
     content = user_msg.get("content") or ""
-    schema_snippet = json.dumps(EVALUATION_JSON_SCHEMA, indent=2)
-    assert schema_snippet in content
+    assert EVALUATION_JSON_SCHEMA_TEXT == json.dumps(EVALUATION_JSON_SCHEMA, indent=2)
+    assert EVALUATION_JSON_SCHEMA_TEXT in content
     assert "Question type" in content
     assert "STAR + I" in content
     assert "behavioral" in content
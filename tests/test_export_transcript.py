@@ -1,11 +1,38 @@
 import sys
-from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+_CAND_ROLES = frozenset(("candidate", "user"))
+# role -> (sort rank, export label); ranks order You -> Coach -> System
+_ROLE_MAP = {
+    "candidate": (0, "You"),
+    "user": (0, "You"),
+    "coach": (1, "Coach"),
+    "agent": (1, "Coach"),
+    "assistant": (1, "Coach"),
+    "system": (2, "System"),
+}
+_OTHER_ROLE = (3, "System")
+
+
+if sys.version_info >= (3, 11):
+    # 3.11+ accepts the trailing "Z" natively
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(ts):
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=None)
+def _parse_ts(ts):
+    """Return (has_ts, epoch_seconds) for an ISO timestamp; (False, inf) when invalid."""
+    if not ts:
+        return (False, float("inf"))
+    try:
+        return (True, _fromisoformat(ts).timestamp())
+    except Exception:
+        return (False, float("inf"))
 
 
 def _export_lines_from_payload(payload: dict):
@@ -13,83 +40,55 @@ def _export_lines_from_payload(payload: dict):
 
     This mirrors app/static/js/app.js: exportFullTranscript()
     - backfill 'You' from voice_transcripts when no candidate message exists
-    - sort by timestamp when both entries have it
-    - otherwise by question_index and role order (You -> Coach -> System)
+    - single-pass sort on (has timestamp, timestamp, question_index, role
+      order You -> Coach -> System, original position): entries without a
+      timestamp come first; equal timestamps fall through to question_index,
+      then role order, then original position
     - coalesce consecutive 'You' lines
     """
-    msgs = list(payload.get("voice_messages") or [])
-
-    # Backfill from per-question transcripts as synthetic 'candidate' lines
     transcripts = payload.get("voice_transcripts") or {}
-    candidate_idxs = {
-        m.get("question_index")
-        for m in msgs
-        if isinstance(m, dict) and (m.get("role") in ("candidate", "user")) and isinstance(m.get("question_index"), int)
-    }
-    for k, v in transcripts.items():
-        try:
-            idx = int(k)
-        except Exception:
-            continue
-        text = (v or "").strip()
-        if text and idx not in candidate_idxs:
-            msgs.append({"role": "candidate", "text": text, "question_index": idx, "timestamp": ""})
-
-    def _role_rank(m):
-        r = str(m.get("role", "")).lower()
-        if r in ("candidate", "user"):
-            return 0
-        if r in ("coach", "agent", "assistant"):
-            return 1
-        if r == "system":
-            return 2
-        return 3
-
-    def _has_ts(m):
-        ts = m.get("timestamp")
-        if not ts:
-            return False
-        try:
-            datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            return True
-        except Exception:
-            return False
-
-    def _ts_val(m):
-        # Safe parse after _has_ts
-        ts = m.get("timestamp")
-        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
-
-    with_index = [{**m, "_i": i} for i, m in enumerate(msgs)]
+    msgs = payload.get("voice_messages") or []
+
+    # Backfill from per-question transcripts as synthetic 'candidate' lines;
+    # copy first so the payload's own list is never mutated.
+    if transcripts:
+        msgs = list(msgs)
+        candidate_idxs = {
+            m.get("question_index")
+            for m in msgs
+            if isinstance(m, dict) and m.get("role") in _CAND_ROLES and isinstance(m.get("question_index"), int)
+        }
+        for k, v in transcripts.items():
+            try:
+                idx = int(k)
+            except Exception:
+                continue
+            text = (v or "").strip()
+            if text and idx not in candidate_idxs:
+                msgs.append({"role": "candidate", "text": text, "question_index": idx, "timestamp": ""})
 
     def _qidx(m):
         qi = m.get("question_index")
         return qi if isinstance(qi, int) else float("inf")
 
-    with_index.sort(
-        key=lambda m: (
-            # When both have timestamp, sorting reduces to timestamp due to comparator equivalence
-            0,
-            _qidx(m),
-            _role_rank(m),
-            m["_i"],
-        )
-    )
-
-    # Because we can't compare pairs here like JS comparator, perform a second pass
-    # to stably re-sort groups where both sides have valid timestamps
-    # (stable sort keeps previous question/role grouping when timestamps missing)
-    with_index.sort(key=lambda m: (_has_ts(m), _ts_val(m) if _has_ts(m) else float("inf")))
+    # Decorate each message with a single composite sort key equivalent to the
+    # JS comparator's precedence: timestamped entries by time, then question
+    # index, role order and original position.
+    entries = []
+    for i, m in enumerate(msgs):
+        # Rank is case-insensitive but the label matches the raw role exactly,
+        # as in the JS roleRank and label mapping.
+        key = str(m.get("role", "")).lower()
+        rank, label = _ROLE_MAP.get(key, _OTHER_ROLE)
+        if m.get("role") != key:
+            label = "System"
+        has_ts, t = _parse_ts(m.get("timestamp"))
+        entries.append(((has_ts, t, _qidx(m), rank, i), label, m))
+    entries.sort(key=lambda e: e[0])
 
     # Coalesce consecutive 'You'
     out = []
-    for m in with_index:
-        role = (
-            "Coach"
-            if m.get("role") in ("coach", "agent", "assistant")
-            else "You" if m.get("role") in ("candidate", "user")
-            else "System"
-        )
+    for _, role, m in entries:
         text = (m.get("text") or "").strip()
         ts = m.get("timestamp") or ""
         if out and role == "You" and out[-1]["role"] == "You":
@@ -158,3 +157,21 @@ def test_export_coalesces_consecutive_you_lines():
     assert len(lines) == 2
     assert lines[0]["role"] == "You" and lines[0]["text"] == "Part A Part B"
     assert lines[1]["role"] == "Coach"
+
+
+def test_export_labels_mixed_case_roles_as_system():
+    # app.js ranks roles case-insensitively but labels them by exact match.
+    payload = {
+        "voice_messages": [
+            {"role": "Coach", "text": "hi", "question_index": 0},
+            {"role": "USER", "text": "a", "question_index": 0},
+            {"role": "User", "text": "b", "question_index": 0},
+        ],
+        "voice_transcripts": {},
+    }
+    lines = _export_lines_from_payload(payload)
+    assert [(l["role"], l["text"]) for l in lines] == [
+        ("System", "a"),
+        ("System", "b"),
+        ("System", "hi"),
+    ]
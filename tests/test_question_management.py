@@ -1,15 +1,6 @@
-import sys
-from pathlib import Path
-
-import pytest
-from fastapi.testclient import TestClient
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import app.main as main  # noqa: E402
-import app.utils.session_store as store  # noqa: E402
+import app.main as main
+import app.utils.session_store as store
+from fixtures import make_payload
 
 
 class _StubAgent:
@@ -22,30 +13,18 @@ class _StubAgent:
         return self.generated[:num_questions]
 
 
-def test_generate_additional_questions_appends(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
+def test_generate_additional_questions_appends(client):
     sid = "s-gen-more"
     agent = _StubAgent(["New Q2", "New Q3", "New Q4"])
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "R",
-        "job_desc_text": "JD",
-        "name": "gen_more",
-        "questions": ["Q1"],
-        "per_question": [None],
-        "answers": [],
-        "evaluations": [],
-        "agent": agent,
-        "current_question_index": 0,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
+    payload = make_payload(
+        name="gen_more",
+        questions=["Q1"],
+        per_question=[None],
+        agent=agent,
+    )
     store.save_session(sid, payload)
     main.active_sessions[sid] = payload
 
-    client = TestClient(main.app)
     res = client.post(f"/session/{sid}/questions/generate-more", json={"num_questions": 2})
     assert res.status_code == 200
     data = res.json()
@@ -59,42 +38,35 @@ def test_generate_additional_questions_appends(monkeypatch, tmp_path):
     assert len(session.get("question_followups", [])) == 3
 
 
-def test_delete_questions_reindexes_and_cleans_state(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
+def test_delete_questions_reindexes_and_cleans_state(client):
     sid = "s-del-q"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "R",
-        "job_desc_text": "JD",
-        "name": "del_test",
-        "questions": ["Q1", "Q2", "Q3"],
-        "answers": [
+    payload = make_payload(
+        name="del_test",
+        questions=["Q1", "Q2", "Q3"],
+        answers=[
             {"question": "Q1", "answer": "A1"},
             {"question": "Q2", "answer": "A2"},
         ],
-        "evaluations": [
+        evaluations=[
             {"score": 1, "feedback": "f1"},
             {"score": 2, "feedback": "f2"},
         ],
-        "per_question": [
+        per_question=[
             {"score": 1},
             {"score": 2},
             {"score": 3},
         ],
-        "agent": None,
-        "current_question_index": 2,
-        "voice_transcripts": {"0": "t1", "1": "t2", "2": "t3"},
-        "voice_agent_text": {"0": "c1", "1": "c2", "2": "c3"},
-        "voice_messages": [
+        current_question_index=2,
+        voice_transcripts={"0": "t1", "1": "t2", "2": "t3"},
+        voice_agent_text={"0": "c1", "1": "c2", "2": "c3"},
+        voice_messages=[
             {"role": "candidate", "text": "hi", "question_index": 1},
             {"role": "coach", "text": "hey", "question_index": 2},
         ],
-    }
+    )
     store.save_session(sid, payload)
     main.active_sessions[sid] = payload
 
-    client = TestClient(main.app)
     res = client.request("DELETE", f"/session/{sid}/questions", json={"indices": [1]})
     assert res.status_code == 200
     body = res.json()
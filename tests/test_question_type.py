@@ -1,11 +1,4 @@
-import sys
-from pathlib import Path
-
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
-
-from app.utils.question_type import (  # noqa: E402
+from app.utils.question_type import (
     infer_question_type,
     normalize_question_text,
     resolve_question_type,
@@ -1,19 +1,11 @@
-import sys
-from pathlib import Path
-
 import pytest
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
-
-import app.main as main  # noqa: E402
-import app.utils.session_store as store  # noqa: E402
-from app.config import OPENAI_REALTIME_VOICE  # noqa: E402
+import app.main as main
+import app.utils.session_store as store
+from app.config import OPENAI_REALTIME_VOICE
 
 
-def test_load_session_backfills_voice_fields(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
+def test_load_session_backfills_voice_fields():
     payload = {
         "questions": [],
         "answers": [],
@@ -1,59 +1,45 @@
-import sys
-from pathlib import Path
-
-from fastapi.testclient import TestClient
-
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
-
-import app.main as main  # noqa: E402
-import app.utils.session_store as store  # noqa: E402
-
-
-def _seed_session(tmp_path):
-    sid = "s-settings"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample resume",
-        "job_desc_text": "Sample JD",
-        "name": "settings_test",
-        "questions": ["Q1"],
-        "answers": [],
-        "evaluations": [],
-        "voice_settings": {"voice_id": "verse", "model_id": "gpt-4o-mini", "thinking_effort": "medium", "verbosity": "balanced"},
-        "agent": "placeholder",
-    }
-    main.active_sessions.clear()
-    store.save_session(sid, payload)
-    return sid
-
-
-def test_update_session_settings(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
-    sid = _seed_session(tmp_path)
-    client = TestClient(main.app)
-
-    res = client.patch(
-        f"/session/{sid}/settings",
-        json={"model_id": "gpt-5-mini", "thinking_effort": "high", "verbosity": "low"},
-    )
-    assert res.status_code == 200
-    data = res.json()
-    vs = data.get("voice_settings") or {}
-    assert vs["model_id"] == "gpt-5-mini"
-    assert vs["thinking_effort"] == "high"
-    assert vs["verbosity"] == "low"
+import pytest
+
+import app.main as main
+from fixtures import make_payload
+
+
+pytestmark = pytest.mark.usefixtures("memory_session_store")
+
+
+_SID = "s-settings"
+_PAYLOAD = make_payload(
+    resume_text="Sample resume",
+    job_desc_text="Sample JD",
+    name="settings_test",
+    questions=["Q1"],
+    voice_settings={"voice_id": "verse", "model_id": "gpt-4o-mini", "thinking_effort": "medium", "verbosity": "balanced"},
+    agent="placeholder",
+)
+
+
+@pytest.mark.parametrize(
+    "patch_body,status,expected",
+    [
+        (
+            {"model_id": "gpt-5-mini", "thinking_effort": "high", "verbosity": "low"},
+            200,
+            {"model_id": "gpt-5-mini", "thinking_effort": "high", "verbosity": "low"},
+        ),
+        ({"model_id": "not-real"}, 400, None),
+    ],
+    ids=["valid", "invalid-model"],
+)
+def test_update_session_settings(seed_session, client, patch_body, status, expected):
+    sid = seed_session(_SID, _PAYLOAD)
+
+    res = client.patch(f"/session/{sid}/settings", json=patch_body)
+    assert res.status_code == status
+    if expected is None:
+        return
+    vs = res.json().get("voice_settings") or {}
+    for key, value in expected.items():
+        assert vs[key] == value
 
     session = main._get_session(sid)
     assert session["agent"] is None  # forced restart
-
-
-def test_update_session_settings_rejects_invalid_model(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
-    sid = _seed_session(tmp_path)
-    client = TestClient(main.app)
-
-    res = client.patch(f"/session/{sid}/settings", json={"model_id": "not-real"})
-    assert res.status_code == 400
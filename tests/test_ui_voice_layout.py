@@ -1,38 +1,23 @@
-from pathlib import Path
-
-
-ROOT = Path(__file__).resolve().parents[1]
-JS_PATH = ROOT / "app" / "static" / "js" / "app.js"
-HTML_PATH = ROOT / "app" / "templates" / "index.html"
-
-
-def _read_text(path: Path) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
-
-
-def test_template_has_expected_targets():
-    html = _read_text(HTML_PATH)
+def test_template_has_expected_targets(html_bytes, html_ids):
     # Transcript container should start with max-h-64 and be scrollable
-    assert 'id="voice-transcript"' in html
-    assert 'max-h-64' in html
-    assert 'overflow-y-auto' in html
+    assert "voice-transcript" in html_ids
+    assert b'max-h-64' in html_bytes
+    assert b'overflow-y-auto' in html_bytes
     # Manual input controls exist so they can be toggled hidden during live voice
-    assert 'label for="answer"' in html
-    assert 'id="answer"' in html
-    assert 'id="submit-answer"' in html
-    assert 'id="get-example"' in html
+    assert b'label for="answer"' in html_bytes
+    assert "answer" in html_ids
+    assert "submit-answer" in html_ids
+    assert "get-example" in html_ids
 
 
-def test_set_voice_layout_is_wired_on_start_and_stop():
-    js = _read_text(JS_PATH)
+def test_set_voice_layout_is_wired_on_start_and_stop(js_hits, js_symbols):
     # Function is present and toggles key elements
-    assert 'function setVoiceLayout(isLive)' in js
-    assert 'answerInput.classList.toggle(' in js
-    assert 'answerBtn' in js and 'getExampleBtn' in js
-    assert 'voiceTranscript.classList.toggle(\'max-h-64\'' in js
-    assert 'voiceTranscript.classList.toggle(\'max-h-96\'' in js
+    assert 'setVoiceLayout' in js_symbols
+    assert 'answerInput.classList.toggle(' in js_hits
+    assert 'answerBtn' in js_symbols and 'getExampleBtn' in js_symbols
+    assert 'voiceTranscript.classList.toggle(\'max-h-64\'' in js_hits
+    assert 'voiceTranscript.classList.toggle(\'max-h-96\'' in js_hits
     # Called when starting/stopping a voice session
-    assert 'setVoiceLayout(true);' in js
-    assert 'setVoiceLayout(false);' in js
+    assert 'setVoiceLayout(true);' in js_hits
+    assert 'setVoiceLayout(false);' in js_hits
 
@@ -1,30 +1,24 @@
-import io
-import sys
 import uuid
-from pathlib import Path
 
-from fastapi.testclient import TestClient
+import pytest
 
+import app.main as main
+from fixtures import make_payload
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
 
-import app.main as main  # noqa: E402
+@pytest.fixture
+def uploaded_sessions(client):
+    """Collect session ids created by a test and delete them on teardown."""
+    session_ids = []
+    yield session_ids
+    for sid in session_ids:
+        try:
+            client.delete(f"/session/{sid}")
+        except Exception:
+            pass
 
 
-HTML_PATH = ROOT / "app" / "templates" / "index.html"
-JS_PATH = ROOT / "app" / "static" / "js" / "app.js"
-
-
-def _read_text(p: Path) -> str:
-    with open(p, "r", encoding="utf-8") as f:
-        return f.read()
-
-
-def test_upload_with_pasted_job_desc_text_only():
-    client = TestClient(main.app)
-
+def test_upload_with_pasted_job_desc_text_only(client, uploaded_sessions):
     # Build a fake resume file and only paste JD text (no JD file provided)
     files = [
         (
@@ -43,6 +37,7 @@ def test_upload_with_pasted_job_desc_text_only():
 
     # Verify session reflects the pasted JD text (file ignored)
     sid = payload["session_id"]
+    uploaded_sessions.append(sid)
     s = client.get(f"/session/{sid}/documents")
     assert s.status_code == 200
     docs = s.json()
@@ -50,8 +45,7 @@ def test_upload_with_pasted_job_desc_text_only():
     assert docs.get("job_desc_text") == "JD pasted text"
 
 
-def test_upload_prefers_text_when_both_file_and_text_provided():
-    client = TestClient(main.app)
+def test_upload_prefers_text_when_both_file_and_text_provided(client, uploaded_sessions):
 
     files = [
         ("resume", ("resume.txt", b"R", "text/plain")),
@@ -62,49 +56,38 @@ def test_upload_prefers_text_when_both_file_and_text_provided():
     resp = client.post("/upload-documents", files=files, data=data)
     assert resp.status_code == 200
     sid = resp.json()["session_id"]
+    uploaded_sessions.append(sid)
     docs = client.get(f"/session/{sid}/documents").json()
     # Text should win over file contents
     assert docs["job_desc_text"] == "JD pasted text"
 
 
-def test_upload_form_posts_to_backend():
-    html = _read_text(HTML_PATH)
-    assert 'id="upload-form"' in html
-    assert 'method="post"' in html.lower()
-    assert 'action="/upload-documents"' in html
-    assert 'enctype="multipart/form-data"' in html.lower()
+def test_upload_form_posts_to_backend(html_bytes, html_ids):
+    assert "upload-form" in html_ids
+    assert b'method="post"' in html_bytes.lower()
+    assert b'action="/upload-documents"' in html_bytes
+    assert b'enctype="multipart/form-data"' in html_bytes.lower()
 
 
-def test_js_bundle_has_no_legacy_globals_and_eval_identifiers():
-    js = _read_text(JS_PATH)
+def test_js_bundle_has_no_legacy_globals_and_eval_identifiers(js_hits):
     # After rollback, app.js must not depend on non-existent globals
-    assert "appVoiceConfig" not in js
+    assert "appVoiceConfig" not in js_hits
     # Avoid using 'eval' identifier in arrow funcs (strict-mode safe)
-    assert "forEach(eval =>" not in js
-    assert "(sum, eval)" not in js
+    assert "forEach(eval =>" not in js_hits
+    assert "(sum, eval)" not in js_hits
 
 
-def test_documents_endpoint_returns_texts():
-    client = TestClient(main.app)
+def test_documents_endpoint_returns_texts(client, uploaded_sessions):
     sid = str(uuid.uuid4())
+    uploaded_sessions.append(sid)
     now = "2024-01-01T00:00:00Z"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "R text",
-        "job_desc_text": "JD text",
-        "name": "doc_test",
-        "questions": [],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
+    payload = make_payload(
+        resume_text="R text",
+        job_desc_text="JD text",
+        name="doc_test",
+        created_at=now,
+        updated_at=now,
+    )
     main._persist_session_state(sid, payload)
 
     r = client.get(f"/session/{sid}/documents")
@@ -114,60 +97,49 @@ def test_documents_endpoint_returns_texts():
     assert docs.get("job_desc_text") == "JD text"
 
 
-def test_settings_drawer_controls_present_and_wired():
-    html = _read_text(HTML_PATH)
-    assert 'id="global-settings"' in html
-    assert 'id="voice-settings-drawer"' in html
-    js = _read_text(JS_PATH)
+def test_settings_drawer_controls_present_and_wired(html_ids, js_hits):
+    assert "global-settings" in html_ids
+    assert "voice-settings-drawer" in html_ids
     # Guarded listener prevents ReferenceError when button is present/absent
-    assert "if (openSettingsBtn && voiceSettingsDrawer)" in js
-    assert "openSettingsBtn.addEventListener('click'" in js
-
-
-def test_sessions_modal_controls_present_and_wired():
-    html = _read_text(HTML_PATH)
-    assert 'id="sessions-modal"' in html
-    assert 'id="sessions-modal-select"' in html
-    assert 'id="sessions-rename"' in html
-    assert 'id="sessions-load"' in html
-    js = _read_text(JS_PATH)
-    assert "if (openSessionsBtn && sessionsModal)" in js
-    assert "openSessionsBtn.addEventListener('click'" in js
-    assert "sessionsRenameBtn.addEventListener('click'" in js
-    assert "sessionsLoadBtn.addEventListener('click'" in js
-
-
-def test_mark_for_review_button_and_handler_present():
-    html = _read_text(HTML_PATH)
-    assert 'id="mark-review"' in html
-    js = _read_text(JS_PATH)
-    assert "if (markReviewBtn)" in js
-    assert "markReviewBtn.addEventListener('click'" in js
-    assert "toggleMarkForReview" in js
-
-
-def test_question_management_controls_present():
-    html = _read_text(HTML_PATH)
-    assert 'id="generate-more-count"' in html
-    assert 'id="generate-more-btn"' in html
-    assert 'id="remove-question-select"' in html
-    assert 'id="remove-questions-btn"' in html
-    js = _read_text(JS_PATH)
-    assert "handleGenerateMoreQuestions" in js
-    assert "handleRemoveQuestions" in js
-
-
-def test_voice_model_selects_present():
-    html = _read_text(HTML_PATH)
-    assert 'id="realtime-model-select"' in html
-    assert 'id="realtime-model-select-2"' in html
-    js = _read_text(JS_PATH)
-    assert "realtimeModelSelect" in js
-    assert "realtime_model" in js
-
-
-def test_export_transcript_button_guard_defined():
-    js = _read_text(JS_PATH)
+    assert "if (openSettingsBtn && voiceSettingsDrawer)" in js_hits
+    assert "openSettingsBtn.addEventListener('click'" in js_hits
+
+
+def test_sessions_modal_controls_present_and_wired(html_ids, js_hits):
+    assert "sessions-modal" in html_ids
+    assert "sessions-modal-select" in html_ids
+    assert "sessions-rename" in html_ids
+    assert "sessions-load" in html_ids
+    assert "if (openSessionsBtn && sessionsModal)" in js_hits
+    assert "openSessionsBtn.addEventListener('click'" in js_hits
+    assert "sessionsRenameBtn.addEventListener('click'" in js_hits
+    assert "sessionsLoadBtn.addEventListener('click'" in js_hits
+
+
+def test_mark_for_review_button_and_handler_present(html_ids, js_hits, js_symbols):
+    assert "mark-review" in html_ids
+    assert "if (markReviewBtn)" in js_hits
+    assert "markReviewBtn.addEventListener('click'" in js_hits
+    assert "toggleMarkForReview" in js_symbols
+
+
+def test_question_management_controls_present(html_ids, js_symbols):
+    assert "generate-more-count" in html_ids
+    assert "generate-more-btn" in html_ids
+    assert "remove-question-select" in html_ids
+    assert "remove-questions-btn" in html_ids
+    assert "handleGenerateMoreQuestions" in js_symbols
+    assert "handleRemoveQuestions" in js_symbols
+
+
+def test_voice_model_selects_present(html_ids, js_hits, js_symbols):
+    assert "realtime-model-select" in html_ids
+    assert "realtime-model-select-2" in html_ids
+    assert "realtimeModelSelect" in js_symbols
+    assert "realtime_model" in js_hits
+
+
+def test_export_transcript_button_guard_defined(js_hits, js_symbols):
     # Prevent regressions where undeclared exportTranscriptBtn breaks DOMContentLoaded handler
-    assert "const exportTranscriptBtn" in js
-    assert "if (exportTranscriptBtn)" in js
+    assert "exportTranscriptBtn" in js_symbols
+    assert "if (exportTranscriptBtn)" in js_hits
@@ -1,82 +1,49 @@
-import sys
 import uuid
-from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+from app.main import (
+    VoiceMessagePayload,
+    _get_session,
+    _persist_session_state,
+    append_voice_message,
+)
+from fixtures import make_payload
 
-from app.main import app, _persist_session_state, active_sessions
 
+pytestmark = pytest.mark.usefixtures("memory_session_store")
 
-SESSION_DIR = Path("app/session_store")
 
+_ROLE_SYNONYMS = (
+    ("user", "candidate"),
+    ("candidate", "candidate"),
+    ("agent", "coach"),
+    ("assistant", "coach"),
+)
 
-def _base_session_payload():
-    now = "2024-01-01T00:00:00Z"
-    return {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample resume",
-        "job_desc_text": "Sample job description",
-        "name": "test_session",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
-
-
-@pytest.fixture
-def session_factory():
-    created = []
-
-    def _create():
-        session_id = str(uuid.uuid4())
-        payload = _base_session_payload()
-        _persist_session_state(session_id, payload)
-        created.append(session_id)
-        return session_id
-
-    yield _create
-
-    for session_id in created:
-        active_sessions.pop(session_id, None)
-        path = SESSION_DIR / f"{session_id}.json"
-        if path.exists():
-            path.unlink()
-
-
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-
-def test_candidate_message_persists_transcript_and_metrics(session_factory, client, caplog):
+_AGGREGATE_MESSAGES = (
+    ("user", "Part A"),
+    ("user", "Part B"),
+    ("agent", "Coach A"),
+    ("agent", "Coach B"),
+)
+
+
+@pytest.mark.asyncio
+async def test_candidate_message_persists_transcript_and_metrics(session_factory, caplog):
+    # Calls the route handler directly; HTTP routing is covered by the
+    # client-based tests below.
     session_id = session_factory()
 
     with caplog.at_level("INFO"):
-        response = client.post(
-            f"/session/{session_id}/voice-messages",
-            json={"role": "user", "text": "I enjoy product design", "question_index": 0},
+        result = await append_voice_message(
+            session_id,
+            VoiceMessagePayload(role="user", text="I enjoy product design", question_index=0),
         )
 
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["ok"] is True
+    assert result["ok"] is True
 
-    session_response = client.get(f"/session/{session_id}")
-    assert session_response.status_code == 200
-    session_data = session_response.json()
+    session_data = _get_session(session_id)
 
     assert session_data["voice_messages"][-1]["role"] == "candidate"
     assert session_data["voice_messages"][-1]["text"] == "I enjoy product design"
@@ -90,45 +57,45 @@ def test_candidate_message_persists_transcript_and_metrics(session_factory, clie
     assert "candidate_count=" in metric_message and "coach_count=" in metric_message
 
 
-def test_coach_message_appends_and_updates_history(session_factory, client):
+@pytest.mark.asyncio
+async def test_coach_message_appends_and_updates_history(session_factory):
     session_id = session_factory()
 
-    client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "user", "text": "Candidate response", "question_index": 0},
+    await append_voice_message(
+        session_id,
+        VoiceMessagePayload(role="user", text="Candidate response", question_index=0),
     )
-    response = client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "agent", "text": "Thanks for sharing that detail.", "question_index": 0},
+    result = await append_voice_message(
+        session_id,
+        VoiceMessagePayload(role="agent", text="Thanks for sharing that detail.", question_index=0),
     )
-    assert response.status_code == 200
-    assert response.json()["ok"] is True
+    assert result["ok"] is True
 
-    session_response = client.get(f"/session/{session_id}")
-    data = session_response.json()
+    data = _get_session(session_id)
 
     roles = [entry["role"] for entry in data["voice_messages"]]
     assert roles == ["candidate", "coach"]
     assert data["voice_agent_text"]["0"] == "Thanks for sharing that detail."
 
 
-def test_session_payload_read_by_ui_contains_dual_role_messages(session_factory, client):
+@pytest.mark.asyncio
+async def test_session_payload_read_by_ui_contains_dual_role_messages(session_factory, aclient):
     """Simulate the UI fetch to make sure both roles are present and ordered."""
     session_id = session_factory()
 
-    first_chunk = client.post(
+    first_chunk = await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "user", "text": "This is my answer.", "question_index": 0},
     )
     assert first_chunk.status_code == 200
 
-    second_chunk = client.post(
+    second_chunk = await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "agent", "text": "Coach feedback here.", "question_index": 0},
     )
     assert second_chunk.status_code == 200
 
-    session_data = client.get(f"/session/{session_id}").json()
+    session_data = (await aclient.get(f"/session/{session_id}")).json()
     voice_messages = session_data["voice_messages"]
 
     assert len(voice_messages) == 2
@@ -138,24 +105,25 @@ def test_session_payload_read_by_ui_contains_dual_role_messages(session_factory,
     assert voice_messages[1]["text"] == "Coach feedback here."
 
 
-def test_identical_texts_do_not_cross_roles(session_factory, client):
+@pytest.mark.asyncio
+async def test_identical_texts_do_not_cross_roles(session_factory, aclient):
     """Even identical text snippets must maintain the original roles."""
     session_id = session_factory()
     prompt_text = "Hello and welcome. Let's begin the interview."
 
-    first = client.post(
+    first = await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "user", "text": prompt_text, "question_index": 2},
     )
     assert first.status_code == 200
 
-    second = client.post(
+    second = await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "agent", "text": prompt_text, "question_index": 2},
     )
     assert second.status_code == 200
 
-    data = client.get(f"/session/{session_id}").json()
+    data = _get_session(session_id)
     entries = [entry for entry in data["voice_messages"] if entry.get("question_index") == 2]
     assert entries[0]["role"] == "candidate"
     assert entries[0]["text"] == prompt_text
@@ -163,21 +131,22 @@ def test_identical_texts_do_not_cross_roles(session_factory, client):
     assert entries[1]["text"] == prompt_text
 
 
-def test_voice_messages_include_question_index_in_session_payload(session_factory, client):
+@pytest.mark.asyncio
+async def test_voice_messages_include_question_index_in_session_payload(session_factory, aclient):
     session_id = session_factory()
 
     # Append candidate and coach messages tied to a specific question index
     qidx = 5
-    client.post(
+    await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "user", "text": "My answer for q5", "question_index": qidx},
     )
-    client.post(
+    await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "agent", "text": "Coach feedback for q5", "question_index": qidx},
     )
 
-    payload = client.get(f"/session/{session_id}").json()
+    payload = _get_session(session_id)
     msgs = [m for m in payload["voice_messages"] if m.get("question_index") == qidx]
 
     assert len(msgs) == 2
@@ -185,103 +154,81 @@ def test_voice_messages_include_question_index_in_session_payload(session_factor
     assert msgs[0]["question_index"] == qidx and msgs[1]["question_index"] == qidx
 
 
-def test_role_synonyms_are_normalized(session_factory, client):
-    """Posting assistant/agent should normalize to coach; candidate stays candidate."""
+@pytest.mark.asyncio
+async def test_role_synonyms_are_normalized(session_factory, aclient):
+    """Every accepted role spelling maps to candidate or coach and the matching text bucket."""
     session_id = session_factory()
 
-    # Post as 'assistant' (should become coach)
-    r1 = client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "assistant", "text": "Coach guidance.", "question_index": 1},
-    )
-    assert r1.status_code == 200
-
-    # Post as 'candidate'
-    r2 = client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "candidate", "text": "My answer.", "question_index": 1},
-    )
-    assert r2.status_code == 200
+    # One shared session; each synonym gets its own question index
+    for qidx, (raw_role, _) in enumerate(_ROLE_SYNONYMS):
+        r = await aclient.post(
+            f"/session/{session_id}/voice-messages",
+            json={"role": raw_role, "text": f"{raw_role} text", "question_index": qidx},
+        )
+        assert r.status_code == 200
 
-    data = client.get(f"/session/{session_id}").json()
-    roles = [m["role"] for m in data["voice_messages"] if m.get("question_index") == 1]
-    assert set(roles) == {"coach", "candidate"}
-    assert data["voice_agent_text"]["1"] == "Coach guidance."
-    assert data["voice_transcripts"]["1"] == "My answer."
+    data = _get_session(session_id)
+    roles = {m["question_index"]: m["role"] for m in data["voice_messages"]}
+    assert roles == {qidx: expected for qidx, (_, expected) in enumerate(_ROLE_SYNONYMS)}
+    for qidx, (raw_role, expected) in enumerate(_ROLE_SYNONYMS):
+        bucket = data["voice_transcripts"] if expected == "candidate" else data["voice_agent_text"]
+        assert bucket[str(qidx)] == f"{raw_role} text"
 
 
-def test_transcript_and_coach_text_aggregate_across_messages(session_factory, client):
+@pytest.mark.asyncio
+async def test_transcript_and_coach_text_aggregate_across_messages(session_factory):
     session_id = session_factory()
 
-    # Two user messages for same index
-    client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "user", "text": "Part A", "question_index": 0},
-    )
-    client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "user", "text": "Part B", "question_index": 0},
-    )
-
-    # Two coach messages for same index
-    client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "agent", "text": "Coach A", "question_index": 0},
-    )
-    client.post(
-        f"/session/{session_id}/voice-messages",
-        json={"role": "agent", "text": "Coach B", "question_index": 0},
-    )
+    # Two user then two coach messages for the same index
+    for role, text in _AGGREGATE_MESSAGES:
+        await append_voice_message(
+            session_id,
+            VoiceMessagePayload(role=role, text=text, question_index=0),
+        )
 
-    data = client.get(f"/session/{session_id}").json()
+    data = _get_session(session_id)
     assert data["voice_transcripts"]["0"] == "Part A\nPart B"
     assert data["voice_agent_text"]["0"] == "Coach A\nCoach B"
 
 
-def test_stream_flag_persists_on_entries(session_factory, client):
+@pytest.mark.asyncio
+async def test_stream_flag_persists_on_entries(session_factory, aclient):
     session_id = session_factory()
-    client.post(
+    await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "user", "text": "interim", "question_index": 2, "stream": True},
     )
-    client.post(
+    await aclient.post(
         f"/session/{session_id}/voice-messages",
         json={"role": "user", "text": "final", "question_index": 2, "stream": False},
     )
-    data = client.get(f"/session/{session_id}").json()
+    data = _get_session(session_id)
     entries = [m for m in data["voice_messages"] if m.get("question_index") == 2]
     assert entries[0]["text"] == "interim" and entries[0].get("stream") is True
     assert entries[1]["text"] == "final" and entries[1].get("stream") is False
 
 
-def test_legacy_session_backfills_missing_voice_fields(client):
+@pytest.mark.asyncio
+async def test_legacy_session_backfills_missing_voice_fields(aclient):
     """Older sessions without voice keys are backfilled with defaults on read."""
-    import uuid
     sid = str(uuid.uuid4())
     now = "2024-01-01T00:00:00Z"
-    legacy_payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample",
-        "job_desc_text": "Sample JD",
-        "name": "legacy",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
+    legacy_payload = make_payload(
+        resume_text="Sample",
+        job_desc_text="Sample JD",
+        name="legacy",
+        questions=["Tell me about yourself."],
+        created_at=now,
+        updated_at=now,
         # Missing or None voice fields
-        "voice_transcripts": None,
-        "voice_agent_text": None,
-        "voice_messages": None,
-    }
+        voice_transcripts=None,
+        voice_agent_text=None,
+        voice_messages=None,
+    )
     # Persist directly via internal helper
-    from app.main import _persist_session_state
     _persist_session_state(sid, legacy_payload)
 
-    res = client.get(f"/session/{sid}")
+    res = await aclient.get(f"/session/{sid}")
     assert res.status_code == 200
     payload = res.json()
     assert isinstance(payload.get("voice_transcripts"), dict)
@@ -1,42 +1,26 @@
-import sys
-from pathlib import Path
+import pytest
 
-from fastapi.testclient import TestClient
+import app.main as main
+from app.config import OPENAI_REALTIME_VOICE
+from fixtures import make_fake_httpx_client, make_payload
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
 
-import app.main as main  # noqa: E402
-import app.utils.session_store as store  # noqa: E402
-from app.config import OPENAI_REALTIME_VOICE  # noqa: E402
+pytestmark = pytest.mark.usefixtures("memory_session_store")
 
 
-def _seed_session(tmp_path):
-    sid = "s-voice"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample resume",
-        "job_desc_text": "Sample JD",
-        "name": "voice_test",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-    }
-    main.active_sessions.clear()
-    store.save_session(sid, payload)
-    return sid
+_SID = "s-voice"
+_PAYLOAD = make_payload(
+    resume_text="Sample resume",
+    job_desc_text="Sample JD",
+    name="voice_test",
+    questions=["Tell me about yourself."],
+    created_at="2024-01-01T00:00:00Z",
+    updated_at="2024-01-01T00:00:00Z",
+)
 
 
-def test_voice_messages_persist_both_roles(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
-    client = TestClient(main.app)
-    sid = _seed_session(tmp_path)
+def test_voice_messages_persist_both_roles(seed_session, client):
+    sid = seed_session(_SID, _PAYLOAD)
 
     r1 = client.post(
         f"/session/{sid}/voice-messages",
@@ -59,51 +43,13 @@ def test_voice_messages_persist_both_roles(monkeypatch, tmp_path):
     assert session["voice_agent_text"]["0"].startswith("coach reply")
 
 
-def _fake_realtime_client(record):
-    class _FakeAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
-        async def post(self, url, headers=None, json=None):
-            record["url"] = url
-            record["headers"] = headers
-            record["json"] = json
-
-            class _Resp:
-                status_code = 200
-
-                def raise_for_status(self_inner):
-                    return None
-
-                def json(self_inner):
-                    return {
-                        "id": "rt_123",
-                        "model": json.get("model"),
-                        "client_secret": {"value": "secret"},
-                        "expires_at": 123,
-                    }
-
-            return _Resp()
-
-    return _FakeAsyncClient
-
-
-def test_realtime_session_payload_includes_transcription(monkeypatch, tmp_path):
-    monkeypatch.setattr(store, "SESSION_DIR", tmp_path)
-    main.active_sessions.clear()
-    sid = _seed_session(tmp_path)
+def test_realtime_session_payload_includes_transcription(seed_session, client, monkeypatch):
+    sid = seed_session(_SID, _PAYLOAD)
 
     monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
     captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_realtime_client(captured))
+    monkeypatch.setattr(main.httpx, "AsyncClient", make_fake_httpx_client(captured))
 
-    client = TestClient(main.app)
     res = client.post("/voice/session", json={"session_id": sid})
     assert res.status_code == 200
     payload = captured["json"]
@@ -1,141 +1,91 @@
 import json
 import os
-import sys
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
+import app.main as main
+from fixtures import make_fake_httpx_client, make_payload
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
 
-import app.main as main  # noqa: E402
+CATALOG_PATH = Path(main.__file__).parent / "voice_catalog.json"
 
 
-CATALOG_PATH = Path(main.__file__).parent / "voice_catalog.json"
-VOICES_DIR = ROOT_DIR / "app" / "static" / "voices"
+_EXPECTED_VOICE_IDS = frozenset({
+    "alloy", "ash", "ballad", "cedar", "coral",
+    "echo", "marin", "sage", "shimmer", "verse",
+})
+_BASE_CATALOG = json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
 
 
-def _read_catalog():
-    with open(CATALOG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+@pytest.fixture
+def catalog_with(monkeypatch):
+    """Serve the shipped catalog plus one synthetic voice, without touching the file."""
 
+    def _add(voice_id, label):
+        voices = _BASE_CATALOG + [{"id": voice_id, "label": label, "preview_url": f"/voices/preview/{voice_id}"}]
+        monkeypatch.setattr(main, "_catalog_lookup", lambda: voices)
+        return voices
 
-def _write_catalog(data):
-    with open(CATALOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    return _add
 
 
 @pytest.fixture
-def client():
-    return TestClient(main.app)
+def voices_dir(monkeypatch, tmp_path):
+    """Cache preview MP3s under tmp_path instead of app/static/voices."""
+    monkeypatch.setattr(main, "VOICES_DIR", str(tmp_path))
+    return tmp_path
 
 
-def test_preview_serves_cached_file(client, tmp_path):
-    voices = _read_catalog()
+def test_preview_serves_cached_file(client, catalog_with, voices_dir):
     test_id = "testcached"
-    try:
-        # Ensure catalog entry exists and mtime changes
-        if not any(v.get("id") == test_id for v in voices):
-            voices.append({"id": test_id, "label": "Test Cached", "preview_url": f"/voices/preview/{test_id}"})
-            _write_catalog(voices)
-
-        # Create a dummy cached mp3
-        VOICES_DIR.mkdir(parents=True, exist_ok=True)
-        p = VOICES_DIR / f"{test_id}-preview.mp3"
-        payload = b"ID3FAKE-CACHED"
-        with open(p, "wb") as f:
-            f.write(payload)
-
-        r = client.get(f"/voices/preview/{test_id}")
-        assert r.status_code == 200
-        assert r.headers.get("content-type", "").startswith("audio/mpeg")
-        assert r.content == payload
-    finally:
-        # Cleanup
-        try:
-            (VOICES_DIR / f"{test_id}-preview.mp3").unlink()
-        except FileNotFoundError:
-            pass
-        # Restore catalog
-        base = [v for v in _read_catalog() if v.get("id") != test_id]
-        _write_catalog(base)
-
-
-def _fake_tts_client_factory(audio_bytes: bytes, record: dict):
-    class _FakeAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    catalog_with(test_id, "Test Cached")
+    # Create a dummy cached mp3
+    payload = b"ID3FAKE-CACHED"
+    (voices_dir / f"{test_id}-preview.mp3").write_bytes(payload)
 
-        async def __aenter__(self):
-            return self
+    r = client.get(f"/voices/preview/{test_id}")
+    assert r.status_code == 200
+    assert r.headers.get("content-type", "").startswith("audio/mpeg")
+    assert r.content == payload
 
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
 
-        async def post(self, url, headers=None, json=None):
-            record["url"] = url
-            record["headers"] = headers
-            record["json"] = json
+def test_preview_synthesizes_and_writes_cache(client, monkeypatch, catalog_with, voices_dir):
+    test_id = "newsynth"
+    catalog_with(test_id, "New Synth")
 
-            class _Resp:
-                status_code = 200
-                content = audio_bytes
+    # Mock API key and TTS HTTP client
+    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
+    fake_audio = b"ID3FAKE-SYNTH"
+    captured = {}
+    fake_client = make_fake_httpx_client(captured, response_json=None, response_content=fake_audio)
+    monkeypatch.setattr(main.httpx, "AsyncClient", fake_client)
 
-                def raise_for_status(self):
-                    return None
+    r = client.get(f"/voices/preview/{test_id}")
+    assert r.status_code == 200
+    assert r.headers.get("content-type", "").startswith("audio/mpeg")
+    assert r.content == fake_audio
+    assert captured["json"]["voice"] == test_id
+    # Cached file written
+    assert (voices_dir / f"{test_id}-preview.mp3").read_bytes() == fake_audio
 
-            return _Resp()
 
-    return _FakeAsyncClient
+def test_preview_cache_hit_skips_tts(client, monkeypatch, catalog_with, voices_dir):
+    test_id = "newsynth"
+    catalog_with(test_id, "New Synth")
+    cached = b"ID3FAKE-SYNTH"
+    (voices_dir / f"{test_id}-preview.mp3").write_bytes(cached)
 
+    # Any TTS call would fail the test
+    class _FailClient:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("TTS should not be called when cache exists")
 
-def test_preview_synthesizes_and_caches_when_missing(client, monkeypatch):
-    voices = _read_catalog()
-    test_id = "newsynth"
-    mp3_path = VOICES_DIR / f"{test_id}-preview.mp3"
-    try:
-        if not any(v.get("id") == test_id for v in voices):
-            voices.append({"id": test_id, "label": "New Synth", "preview_url": f"/voices/preview/{test_id}"})
-            _write_catalog(voices)
-
-        # Ensure no cached file
-        if mp3_path.exists():
-            mp3_path.unlink()
-
-        # Mock API key and TTS HTTP client
-        monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-        fake_audio = b"ID3FAKE-SYNTH"
-        captured = {}
-        monkeypatch.setattr(main.httpx, "AsyncClient", _fake_tts_client_factory(fake_audio, captured))
-
-        r = client.get(f"/voices/preview/{test_id}")
-        assert r.status_code == 200
-        assert r.headers.get("content-type", "").startswith("audio/mpeg")
-        assert r.content == fake_audio
-        # Cached file written
-        assert mp3_path.exists() and mp3_path.stat().st_size == len(fake_audio)
-
-        # On second call, ensure it serves cached file (no TTS). Replace client to raise if called.
-        class _FailClient:
-            async def __aenter__(self):
-                raise AssertionError("TTS should not be called when cache exists")
-            async def __aexit__(self, *args, **kwargs):
-                return False
-
-        monkeypatch.setattr(main.httpx, "AsyncClient", _FailClient)
-        r2 = client.get(f"/voices/preview/{test_id}")
-        assert r2.status_code == 200
-        assert r2.content == fake_audio
-    finally:
-        try:
-            mp3_path.unlink()
-        except FileNotFoundError:
-            pass
-        base = [v for v in _read_catalog() if v.get("id") != test_id]
-        _write_catalog(base)
+    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
+    monkeypatch.setattr(main.httpx, "AsyncClient", _FailClient)
+    r = client.get(f"/voices/preview/{test_id}")
+    assert r.status_code == 200
+    assert r.content == cached
 
 
 def test_preview_unknown_voice_returns_404(client):
@@ -144,65 +94,47 @@ def test_preview_unknown_voice_returns_404(client):
     assert r.status_code == 404
 
 
-def test_preview_returns_503_without_key_and_no_cache(client):
-    voices = _read_catalog()
+def test_preview_returns_503_without_key_and_no_cache(client, monkeypatch, catalog_with, voices_dir):
     test_id = "nokey"
-    try:
-        if not any(v.get("id") == test_id for v in voices):
-            voices.append({"id": test_id, "label": "No Key", "preview_url": f"/voices/preview/{test_id}"})
-            _write_catalog(voices)
-        mp3 = VOICES_DIR / f"{test_id}-preview.mp3"
-        if mp3.exists():
-            mp3.unlink()
-        # Ensure API key is blank
-        main.OPENAI_API_KEY = ""
-        r = client.get(f"/voices/preview/{test_id}")
-        assert r.status_code == 503
-    finally:
-        try:
-            (VOICES_DIR / f"{test_id}-preview.mp3").unlink()
-        except FileNotFoundError:
-            pass
-        base = [v for v in _read_catalog() if v.get("id") != test_id]
-        _write_catalog(base)
-
-
-def test_catalog_cache_invalidation(client):
-    original = _read_catalog()
+    catalog_with(test_id, "No Key")
+    # Ensure API key is blank
+    monkeypatch.setattr(main, "OPENAI_API_KEY", "")
+    r = client.get(f"/voices/preview/{test_id}")
+    assert r.status_code == 503
+
+
+def test_catalog_cache_invalidation(client, monkeypatch, tmp_path):
+    # Point the app at a scratch copy so the shipped catalog is never rewritten
+    catalog_path = tmp_path / "voice_catalog.json"
+    catalog_path.write_text(json.dumps(_BASE_CATALOG), encoding="utf-8")
+    os.utime(catalog_path, (1, 1))
+    monkeypatch.setattr(main, "VOICE_CATALOG_PATH", str(catalog_path))
     new_id = "tmpinvalidate"
-    try:
-        if not any(v.get("id") == new_id for v in original):
-            updated = list(original) + [{"id": new_id, "label": "Tmp", "preview_url": f"/voices/preview/{new_id}"}]
-            _write_catalog(updated)
-        res = client.get("/voices")
-        assert res.status_code == 200
-        ids = {v.get("id") for v in res.json()}
-        assert new_id in ids
-    finally:
-        _write_catalog(original)
+
+    ids = {v.get("id") for v in client.get("/voices").json()}
+    assert new_id not in ids
+
+    updated = _BASE_CATALOG + [{"id": new_id, "label": "Tmp", "preview_url": f"/voices/preview/{new_id}"}]
+    catalog_path.write_text(json.dumps(updated), encoding="utf-8")
+    os.utime(catalog_path, (2, 2))
+    res = client.get("/voices")
+    assert res.status_code == 200
+    ids = {v.get("id") for v in res.json()}
+    assert new_id in ids
 
 
 def test_session_payload_includes_voice_settings(client):
     # Create a minimal session
     sid = "session_voice_settings"
     now = "2024-01-01T00:00:00Z"
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample",
-        "job_desc_text": "Sample JD",
-        "name": "voice_test",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
+    payload = make_payload(
+        resume_text="Sample",
+        job_desc_text="Sample JD",
+        name="voice_test",
+        questions=["Tell me about yourself."],
+        created_at=now,
+        updated_at=now,
+    )
     main._persist_session_state(sid, payload)
     r = client.patch(f"/session/{sid}/voice", json={"voice_id": "verse"})
     assert r.status_code == 200
@@ -215,10 +147,4 @@ def test_session_payload_includes_voice_settings(client):
 def test_voices_list_includes_all_expected_ids(client):
     res = client.get("/voices")
     assert res.status_code == 200
-    ids = {v.get("id") for v in res.json()}
-    expected = {
-        "alloy", "ash", "ballad", "cedar", "coral",
-        "echo", "marin", "sage", "shimmer", "verse",
-    }
-    assert expected.issubset(ids)
-
+    assert _EXPECTED_VOICE_IDS.issubset(v.get("id") for v in res.json())
@@ -1,19 +1,5 @@
-import sys
-from pathlib import Path
-
-import pytest
-from fastapi.testclient import TestClient
-
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
-
-import app.main as main  # noqa: E402
-
-
-@pytest.fixture
-def client():
-    return TestClient(main.app)
+import app.main as main
+from fixtures import make_fake_httpx_client, make_payload
 
 
 def test_get_voices_catalog(client):
@@ -26,59 +12,22 @@ def test_get_voices_catalog(client):
     assert "gpt-realtime" in ids
 
 
-def _fake_async_client_factory(captured: dict):
-    class _FakeAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
-        async def post(self, url, headers=None, json=None):
-            captured["url"] = url
-            captured["headers"] = headers
-            captured["json"] = json
-            class _Dummy:
-                def __init__(self):
-                    self.status_code = 200
-                def raise_for_status(self):
-                    return None
-                def json(self):
-                    return {
-                        "id": "sess_abc",
-                        "model": json.get("model", "gpt-realtime-mini"),
-                        "client_secret": {"value": "secret_xyz"},
-                        "expires_at": 4102444800,
-                    }
-            return _Dummy()
-    return _FakeAsyncClient
+def _session_payload():
+    return make_payload(
+        resume_text="Sample",
+        job_desc_text="Sample JD",
+        name="voice_test",
+        questions=["Tell me about yourself."],
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+    )
 
 
-def test_set_voice_persists_and_used_in_realtime(client, monkeypatch, tmp_path):
+def test_set_voice_persists_and_used_in_realtime(client, monkeypatch):
     # Create a new session using the existing upload flow shortcuts
     # Build a dummy session via direct persist to avoid heavy flows
     sid = 'session_for_voice'
-    payload = {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample",
-        "job_desc_text": "Sample JD",
-        "name": "voice_test",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
-    main._persist_session_state(sid, payload)
+    main._persist_session_state(sid, _session_payload())
 
     # Update voice to a known catalog id
     r = client.patch(f"/session/{sid}/voice", json={"voice_id": "verse"})
@@ -88,7 +37,7 @@ def test_set_voice_persists_and_used_in_realtime(client, monkeypatch, tmp_path):
     # Stub HTTP client and assert voice is passed in realtime payload
     captured = {}
     monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    monkeypatch.setattr(main.httpx, "AsyncClient", make_fake_httpx_client(captured))
     resp = client.post('/voice/session', json={"session_id": sid})
     assert resp.status_code == 200
     payload = captured.get('json')
@@ -99,22 +48,6 @@ def test_set_voice_persists_and_used_in_realtime(client, monkeypatch, tmp_path):
 def test_set_voice_rejects_unknown_id(client):
     # Attempt to set a non-existent voice id
     sid = 'session_unknown_voice'
-    main._persist_session_state(sid, {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample",
-        "job_desc_text": "Sample JD",
-        "name": "voice_test",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": "2024-01-01T00:00:00Z",
-        "updated_at": "2024-01-01T00:00:00Z",
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    })
+    main._persist_session_state(sid, _session_payload())
     r = client.patch(f"/session/{sid}/voice", json={"voice_id": "does-not-exist"})
     assert r.status_code == 400
@@ -1,124 +1,39 @@
-import sys
-import uuid
-from pathlib import Path
-
 import pytest
-from fastapi.testclient import TestClient
-
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
-
-import app.main as main  # noqa: E402
-
-
-SESSION_DIR = Path("app/session_store")
-
-
-def _base_session_payload():
-    now = "2024-01-01T00:00:00Z"
-    return {
-        "resume_path": "uploads/resume.txt",
-        "job_desc_path": "uploads/job.txt",
-        "resume_text": "Sample resume",
-        "job_desc_text": "Sample job description",
-        "name": "test_session",
-        "questions": ["Tell me about yourself."],
-        "answers": [],
-        "evaluations": [],
-        "agent": None,
-        "current_question_index": 0,
-        "created_at": now,
-        "updated_at": now,
-        "voice_transcripts": {},
-        "voice_agent_text": {},
-        "voice_messages": [],
-    }
 
+import app.main as main
+from fixtures import make_fake_httpx_client
 
-@pytest.fixture
-def session_factory():
-    created = []
 
-    def _create():
-        session_id = str(uuid.uuid4())
-        payload = _base_session_payload()
-        main._persist_session_state(session_id, payload)
-        created.append(session_id)
-        return session_id
+pytestmark = pytest.mark.usefixtures("memory_session_store")
 
-    yield _create
 
-    for session_id in created:
-        main.active_sessions.pop(session_id, None)
-        path = SESSION_DIR / f"{session_id}.json"
-        if path.exists():
-            path.unlink()
+@pytest.fixture(autouse=True)
+def captured(monkeypatch):
+    """Outbound realtime request recorded by the fake httpx client."""
+    record = {}
+    monkeypatch.setattr(main.httpx, "AsyncClient", make_fake_httpx_client(record))
+    return record
 
 
 @pytest.fixture
-def client():
-    return TestClient(main.app)
-
-
-class _DummyResponse:
-    def __init__(self, payload: dict, status_code: int = 200):
-        self._payload = payload
-        self.status_code = status_code
-
-    def raise_for_status(self):
-        if self.status_code and self.status_code >= 400:
-            # Mimic httpx exception shape when needed
-            raise Exception(f"HTTP {self.status_code}")
-
-    def json(self):
-        return self._payload
-
-    @property
-    def text(self):
-        return str(self._payload)
+def voice_env(monkeypatch):
+    """Apply app.main config overrides; OPENAI_API_KEY defaults to a test key."""
 
+    def _apply(**overrides):
+        overrides.setdefault("OPENAI_API_KEY", "test_key")
+        for name, value in overrides.items():
+            monkeypatch.setattr(main, name, value)
 
-def _fake_async_client_factory(captured: dict):
-    class _FakeAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
-        async def post(self, url, headers=None, json=None):
-            captured["url"] = url
-            captured["headers"] = headers
-            captured["json"] = json
-            # Return a minimal successful realtime session response
-            return _DummyResponse(
-                {
-                    "id": "sess_123",
-                    "model": json.get("model", "gpt-realtime-mini"),
-                    "client_secret": {"value": "secret_abc"},
-                    # Any epoch-like int works for model validation
-                    "expires_at": 4102444800,
-                }
-            )
-
-    return _FakeAsyncClient
+    return _apply
 
 
 def test_voice_session_includes_input_transcription_when_configured(
-    session_factory, client, monkeypatch
+    session_factory, client, voice_env, captured
 ):
     session_id = session_factory()
 
     # Ensure API key and config are set for the endpoint
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    monkeypatch.setattr(main, "OPENAI_INPUT_TRANSCRIPTION_MODEL", "gpt-4o-mini-transcribe")
-
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env(OPENAI_INPUT_TRANSCRIPTION_MODEL="gpt-4o-mini-transcribe")
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200
@@ -134,16 +49,12 @@ def test_voice_session_includes_input_transcription_when_configured(
 
 
 def test_voice_session_omits_input_transcription_when_disabled(
-    session_factory, client, monkeypatch
+    session_factory, client, voice_env, captured
 ):
     session_id = session_factory()
 
     # Disable server-side transcription via empty model string
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    monkeypatch.setattr(main, "OPENAI_INPUT_TRANSCRIPTION_MODEL", "")
-
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env(OPENAI_INPUT_TRANSCRIPTION_MODEL="")
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200
@@ -154,16 +65,14 @@ def test_voice_session_omits_input_transcription_when_disabled(
 
 
 def test_voice_session_turn_detection_none_sets_type_none(
-    session_factory, client, monkeypatch
+    session_factory, client, voice_env, captured
 ):
     session_id = session_factory()
 
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    monkeypatch.setattr(main, "OPENAI_INPUT_TRANSCRIPTION_MODEL", "gpt-4o-mini-transcribe")
-    monkeypatch.setattr(main, "OPENAI_TURN_DETECTION", "none")
-
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env(
+        OPENAI_INPUT_TRANSCRIPTION_MODEL="gpt-4o-mini-transcribe",
+        OPENAI_TURN_DETECTION="none",
+    )
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200
@@ -174,19 +83,17 @@ def test_voice_session_turn_detection_none_sets_type_none(
 
 
 def test_voice_session_server_vad_parses_thresholds(
-    session_factory, client, monkeypatch
+    session_factory, client, voice_env, captured
 ):
     session_id = session_factory()
 
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    monkeypatch.setattr(main, "OPENAI_TURN_DETECTION", "server_vad")
     # Provide string inputs to validate parsing into float/int types
-    monkeypatch.setattr(main, "OPENAI_TURN_THRESHOLD", "0.7")
-    monkeypatch.setattr(main, "OPENAI_TURN_PREFIX_MS", "250")
-    monkeypatch.setattr(main, "OPENAI_TURN_SILENCE_MS", "600")
-
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env(
+        OPENAI_TURN_DETECTION="server_vad",
+        OPENAI_TURN_THRESHOLD="0.7",
+        OPENAI_TURN_PREFIX_MS="250",
+        OPENAI_TURN_SILENCE_MS="600",
+    )
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200
@@ -201,7 +108,7 @@ def test_voice_session_server_vad_parses_thresholds(
     }
 
 
-def test_voice_session_uses_session_realtime_model(session_factory, client, monkeypatch):
+def test_voice_session_uses_session_realtime_model(session_factory, client, voice_env, captured):
     session_id = session_factory()
     # Seed a custom realtime model on the session
     session = main._get_session(session_id)
@@ -210,9 +117,7 @@ def test_voice_session_uses_session_realtime_model(session_factory, client, monk
     session["voice_settings"] = vs
     main._persist_session_state(session_id, session)
 
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env()
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200
@@ -221,16 +126,14 @@ def test_voice_session_uses_session_realtime_model(session_factory, client, monk
     assert payload.get("model") == "gpt-realtime"
 
 
-def test_voice_session_starts_from_current_question(session_factory, client, monkeypatch):
+def test_voice_session_starts_from_current_question(session_factory, client, voice_env, captured):
     session_id = session_factory()
     session = main._get_session(session_id)
     session["questions"] = ["Q1", "Q2", "Q3", "Q4"]
     session["current_question_index"] = 2
     main._persist_session_state(session_id, session)
 
-    monkeypatch.setattr(main, "OPENAI_API_KEY", "test_key")
-    captured = {}
-    monkeypatch.setattr(main.httpx, "AsyncClient", _fake_async_client_factory(captured))
+    voice_env()
 
     resp = client.post("/voice/session", json={"session_id": session_id})
     assert resp.status_code == 200